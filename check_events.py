@@ -2,17 +2,25 @@
 import os
 import re
 import json
+import time
 import hashlib
-import subprocess
 import sys
-from dataclasses import dataclass
+from operator import attrgetter
+from dataclasses import dataclass, field
 from datetime import datetime
+from html.parser import HTMLParser
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
+import httpx
 from playwright.sync_api import sync_playwright, TimeoutError as PWTimeoutError
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json works everywhere
+    orjson = None
+
 APP_NAME = "ath-events"
 URL = "https://events.bostonathenaeum.org/en/"
 
@@ -20,6 +28,8 @@ URL = "https://events.bostonathenaeum.org/en/"
 STATE_FILE = Path(__file__).with_name("state.json")
 PRETTY_FILE = Path(__file__).with_name("events_pretty.json")
 MD_FILE = Path(__file__).with_name("events.md")
+CACHE_DIR = Path(__file__).with_name("cache")
+USER_DATA_DIR = Path(__file__).with_name(".pw-profile")
 
 # ntfy (allow Actions/local override via env vars)
 NTFY_TOPIC = (os.getenv("NTFY_TOPIC") or "ath-events-notifications").strip()
@@ -31,28 +41,61 @@ MONTHS = {
     "MAY": 5, "JUNE": 6, "JULY": 7, "AUGUST": 8,
     "SEPTEMBER": 9, "OCTOBER": 10, "NOVEMBER": 11, "DECEMBER": 12,
 }
-MONTH_BY_NUM = {v: k for k, v in MONTHS.items()}
+MONTH_NAMES = tuple(sorted(MONTHS, key=MONTHS.get))  # index by month - 1
 
 DATE_HDR_RE = re.compile(
     r"^\s*(JANUARY|FEBRUARY|MARCH|APRIL|MAY|JUNE|JULY|AUGUST|SEPTEMBER|OCTOBER|NOVEMBER|DECEMBER)\s+(\d{1,2}),\s*(\d{4})\s*$",
     re.I,
 )
 
+def json_loads(s):
+    return orjson.loads(s) if orjson is not None else json.loads(s)
+
+def json_dumps_compact(obj) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+def json_dumps_pretty(obj) -> bytes:
+    # Bytes on purpose: orjson serializes straight to UTF-8 and the
+    # consumers (hashing, write_bytes) all want bytes anyway.
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
 def norm(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "")).strip()
+    # str.split() collapses all whitespace runs in C, faster than re.sub.
+    return " ".join((s or "").split())
+
+def payload_hash(events: List["Event"]) -> str:
+    # Change-detection token, not a cryptographic identity: stream the raw
+    # fields through BLAKE2b instead of serializing JSON just to hash it.
+    # Old sha256-of-JSON hashes simply read as "changed" once.
+    h = hashlib.blake2b(digest_size=16)
+    for e in events:
+        h.update(
+            "\x1f".join(
+                (e.url, str(e.year), str(e.month), str(e.day),
+                 e.time_et, e.status, e.title, e.venue, *e.keywords)
+            ).encode("utf-8")
+        )
+        h.update(b"\x1e")
+    return h.hexdigest()
 
-def ci(s: str) -> str:
-    return norm(s).casefold()
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    # Write-then-rename so a crashed run never leaves a truncated file.
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
 
-def sha256(s: str) -> str:
-    return hashlib.sha256(s.encode("utf-8")).hexdigest()
+_HTTP = httpx.Client(timeout=10.0)
 
 def notify(title: str, body: str) -> None:
-    # Silence ntfy response body to keep logs clean.
-    subprocess.run(
-        ["curl", "-sS", "-o", "/dev/null", "-X", "POST", "-H", f"Title: {title}", "-d", body, NTFY_URL],
-        check=False,
-    )
+    # Best-effort, like the old curl with check=False: never fail the run.
+    try:
+        _HTTP.post(NTFY_URL, content=body.encode("utf-8"), headers={"Title": title})
+    except Exception:
+        pass
 
 def looks_like_event_url(u: str) -> bool:
     try:
@@ -69,30 +112,45 @@ def looks_like_event_url(u: str) -> bool:
     return True
 
 def parse_date_header(s: str) -> Optional[Tuple[int, int, int]]:
+    # Shared by the scrape (partition headers) and state reload ("date"
+    # field); both store the same "MONTH D, YYYY" shape.
     m = DATE_HDR_RE.match(norm(s))
     if not m:
         return None
-    mon = m.group(1).upper()
-    day = int(m.group(2))
-    year = int(m.group(3))
-    month = MONTHS.get(mon)
+    month = MONTHS.get(m.group(1).upper())
     if not month:
         return None
-    return (year, month, day)
+    return (int(m.group(3)), month, int(m.group(2)))
+
+_DOW = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+_SAKAMOTO = (0, 3, 2, 5, 0, 3, 5, 1, 4, 6, 2, 4)
+
+def _weekday(year: int, month: int, day: int) -> int:
+    """Mon=0..Sun=6 via Sakamoto's method; -1 for out-of-range fields.
+
+    Pure integer arithmetic — no datetime construction, no cache needed.
+    """
+    if not (1 <= month <= 12 and 1 <= day <= 31):
+        return -1
+    y = year - (month < 3)
+    dow_sun0 = (y + y // 4 - y // 100 + y // 400 + _SAKAMOTO[month - 1] + day) % 7
+    return (dow_sun0 + 6) % 7
 
 def weekday_abbrev(year: int, month: int, day: int) -> str:
-    try:
-        w = datetime(year, month, day).weekday()  # Mon=0..Sun=6
-    except Exception:
-        return "?"
-    return ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"][w]
+    w = _weekday(year, month, day)
+    return _DOW[w] if w >= 0 else "?"
 
 def normalize_status(s: str) -> str:
     s = norm(s).upper()
     s = s.replace("WAIT LISTED", "WAITLISTED")
     return s
 
-@dataclass(frozen=True)
+# Titles/keywords are whitespace-normalized at parse time, so these checks
+# only need to fold case.
+_EXCLUDED_KEYWORDS = frozenset({"children's/family"})
+
+@dataclass(frozen=True, slots=True)
 class Event:
     url: str
     year: int
@@ -103,21 +161,67 @@ class Event:
     title: str
     venue: str
     keywords: Tuple[str, ...]
+    # Derived once at construction; the filter predicates read these instead
+    # of re-folding/re-computing per call.
+    _title_cf: str = field(init=False, repr=False, compare=False)
+    _kw_cf: frozenset = field(init=False, repr=False, compare=False)
+    _is_art_arch: bool = field(init=False, repr=False, compare=False)
+    _is_saturday: bool = field(init=False, repr=False, compare=False)
+    _is_interesting: bool = field(init=False, repr=False, compare=False)
+    _when_str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        _set = object.__setattr__
+        title_cf = self.title.casefold()
+        kw_cf = frozenset(k.casefold() for k in self.keywords)
+        is_art_arch = title_cf == "art & architecture tour"
+        w = _weekday(self.year, self.month, self.day)
+        saturday = w == 5
+        _set(self, "_title_cf", title_cf)
+        _set(self, "_kw_cf", kw_cf)
+        _set(self, "_is_art_arch", is_art_arch)
+        _set(self, "_is_saturday", saturday)
+        mon = MONTH_NAMES[self.month - 1] if 1 <= self.month <= 12 else ""
+        dow = _DOW[w] if w >= 0 else "?"
+        left = f"{mon} {self.day} ({dow})".strip()
+        _set(self, "_when_str", f"{left} {self.time_et} ET" if self.time_et else left)
+        # Spec: not Library Orientation, not Children's/Family, and not
+        # Art & Architecture Tour unless it falls on a Saturday.
+        _set(
+            self,
+            "_is_interesting",
+            "library orientation tour" not in title_cf
+            and _EXCLUDED_KEYWORDS.isdisjoint(kw_cf)
+            and not (is_art_arch and not saturday),
+        )
+
+    @classmethod
+    def _from_fields(cls, url, year, month, day, time_et, status, title, venue, keywords) -> "Event":
+        # Deserialization fast path: assign slots directly instead of going
+        # through the generated frozen __init__.
+        obj = object.__new__(cls)
+        _set = object.__setattr__
+        _set(obj, "url", url)
+        _set(obj, "year", year)
+        _set(obj, "month", month)
+        _set(obj, "day", day)
+        _set(obj, "time_et", time_et)
+        _set(obj, "status", status)
+        _set(obj, "title", title)
+        _set(obj, "venue", venue)
+        _set(obj, "keywords", keywords)
+        obj.__post_init__()
+        return obj
 
     def key(self) -> str:
         return self.url
 
     def date_str(self) -> str:
-        mon = MONTH_BY_NUM.get(self.month, "")
+        mon = MONTH_NAMES[self.month - 1] if 1 <= self.month <= 12 else ""
         return f"{mon} {self.day}, {self.year}".strip()
 
     def when_str(self) -> str:
-        mon = MONTH_BY_NUM.get(self.month, "")
-        dow = weekday_abbrev(self.year, self.month, self.day)
-        left = f"{mon} {self.day} ({dow})".strip()
-        if self.time_et:
-            return f"{left} {self.time_et} ET"
-        return left
+        return self._when_str
 
 def event_to_dict(e: Event) -> dict:
     return {
@@ -132,65 +236,45 @@ def event_to_dict(e: Event) -> dict:
 
 def dict_to_event(d: dict) -> Optional[Event]:
     try:
-        url = norm(d.get("url", ""))
-        date = norm(d.get("date", ""))
-        time_et = norm(d.get("time_et", "")).upper()
-        status = normalize_status(d.get("status", ""))
-        title = norm(d.get("event_title", ""))
-        venue = norm(d.get("venue", ""))
-        keywords = tuple(norm(x) for x in (d.get("keywords") or []))
-
-        m = DATE_HDR_RE.match(date)
-        if not m:
-            return None
-        mon = m.group(1).upper()
-        day = int(m.group(2))
-        year = int(m.group(3))
-        month = MONTHS.get(mon)
-        if not month:
+        _get = d.get
+        ymd = parse_date_header(_get("date", ""))
+        if not ymd:
             return None
+        year, month, day = ymd
 
-        return Event(
-            url=url,
+        return Event._from_fields(
+            url=norm(_get("url", "")),
             year=year,
             month=month,
             day=day,
-            time_et=time_et,
-            status=status,
-            title=title,
-            venue=venue,
-            keywords=keywords,
+            time_et=norm(_get("time_et", "")).upper(),
+            status=normalize_status(_get("status", "")),
+            title=norm(_get("event_title", "")),
+            venue=norm(_get("venue", "")),
+            keywords=tuple(norm(x) for x in (_get("keywords") or [])),
         )
     except Exception:
         return None
 
+# C-level sort keys over slotted attributes; _title_cf is precomputed on
+# the Event so no per-comparison lowercasing happens.
+_EVENT_ORDER = attrgetter("year", "month", "day", "time_et", "_title_cf")
+_EVENT_ORDER_URL = attrgetter("year", "month", "day", "time_et", "_title_cf", "url")
+
 def is_children_family(e: Event) -> bool:
-    return any(ci(k) == "children's/family" for k in e.keywords)
+    return not _EXCLUDED_KEYWORDS.isdisjoint(e._kw_cf)
 
 def is_library_orientation(e: Event) -> bool:
-    return "library orientation tour" in ci(e.title)
+    return "library orientation tour" in e._title_cf
 
 def is_art_arch_tour(e: Event) -> bool:
-    return ci(e.title) == "art & architecture tour"
+    return e._is_art_arch
 
 def is_saturday(e: Event) -> bool:
-    try:
-        return datetime(e.year, e.month, e.day).weekday() == 5
-    except Exception:
-        return False
+    return e._is_saturday
 
 def is_interesting(e: Event) -> bool:
-    # Your spec:
-    # not Library Orientation
-    # not Children's/Family
-    # not Art & Architecture Tour (except Saturday)
-    if is_library_orientation(e):
-        return False
-    if is_children_family(e):
-        return False
-    if is_art_arch_tour(e) and not is_saturday(e):
-        return False
-    return True
+    return e._is_interesting
 
 def fmt_line(e: Event) -> str:
     status = f"[{e.status}] " if e.status else ""
@@ -200,7 +284,7 @@ def load_state() -> Tuple[str, Dict[str, Event]]:
     if not STATE_FILE.exists():
         return ("", {})
     try:
-        old = json.loads(STATE_FILE.read_text(encoding="utf-8"))
+        old = json_loads(STATE_FILE.read_bytes())
         old_hash = old.get("hash", "") or ""
         out: Dict[str, Event] = {}
         for d in old.get("items", []):
@@ -213,27 +297,323 @@ def load_state() -> Tuple[str, Dict[str, Event]]:
     except Exception:
         return ("", {})
 
-def save_state(now: str, events: List[Event], h: str) -> None:
-    payload = {
-        "app": APP_NAME,
-        "checked_at": now,
-        "url": URL,
-        "hash": h,
-        "items": [event_to_dict(e) for e in events],
+def save_state(now: str, items_json: bytes, h: str) -> None:
+    # Splice the pre-serialized items array into the envelope so the event
+    # list is serialized exactly once per run (shared with pretty output).
+    indented_items = items_json.replace(b"\n", b"\n  ")
+    payload = (
+        b"{\n"
+        b'  "app": ' + json.dumps(APP_NAME).encode("utf-8") + b",\n"
+        b'  "checked_at": ' + json.dumps(now).encode("utf-8") + b",\n"
+        b'  "url": ' + json.dumps(URL).encode("utf-8") + b",\n"
+        b'  "hash": ' + json.dumps(h).encode("utf-8") + b",\n"
+        b'  "items": ' + indented_items + b"\n"
+        b"}"
+    )
+    atomic_write_bytes(STATE_FILE, payload)
+
+def fmt_md_line(e: Event) -> str:
+    kw = f" ({', '.join(e.keywords)})" if e.keywords else ""
+    status = f"[{e.status}] " if e.status else ""
+    return f"- {e.when_str()} -- {status}{e.title}{kw}".strip()
+
+def write_outputs(items_json: bytes, events: List[Event]) -> None:
+    # Pretty JSON reuses the one serialization from main; the MD streams
+    # line-by-line through the handle instead of materializing the whole
+    # document, still landing via tmp+rename.
+    atomic_write_bytes(PRETTY_FILE, items_json)
+    tmp = MD_FILE.with_suffix(MD_FILE.suffix + ".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        f.write("# Boston Athenaeum events\n\n")
+        f.writelines(fmt_md_line(e) + "\n" for e in events)
+    os.replace(tmp, MD_FILE)
+
+# Void elements never get an end tag, so they must not bump nesting depth.
+_VOID_TAGS = frozenset({"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"})
+
+class _CardHTMLParser(HTMLParser):
+    """Parses server-rendered listing markup into the same card dicts the
+    in-browser extractor returns, so both paths share one Event builder."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.cards: List[dict] = []
+        self._date_header = ""
+        self._card: Optional[dict] = None
+        self._card_depth = 0
+        self._capture: Optional[str] = None
+        self._capture_depth = 0
+        self._header_depth = 0
+
+    @staticmethod
+    def _classes(attrs: dict) -> List[str]:
+        return (attrs.get("class") or "").split()
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        if tag in _VOID_TAGS:
+            return
+        attrs = dict(attrs)
+        classes = self._classes(attrs)
+
+        if self._card is None:
+            if self._header_depth:
+                self._header_depth += 1
+            elif tag == "h2" and "separator-title" in classes:
+                self._header_depth = 1
+                self._date_header = ""
+            if tag == "a" and "product-item" in classes and attrs.get("href"):
+                self._card = {
+                    "href": attrs["href"],
+                    "title": "", "time": "", "venue": "", "status": "",
+                    "keywords": [], "dateHeader": self._date_header,
+                    "badgeMonth": "", "badgeDay": "",
+                }
+                self._card_depth = 1
+            return
+
+        self._card_depth += 1
+        if self._capture:
+            self._capture_depth += 1
+            return
+        target = None
+        if "product-item__name" in classes:
+            target = "title"
+        elif tag == "time":
+            target = "time"
+        elif "product-item__venue" in classes:
+            target = "venue"
+        elif "product-item__price" in classes and not self._card["status"].strip():
+            target = "status"
+        elif "event-keyword" in classes:
+            target = "keyword"
+        elif "bt-date-badge__month" in classes:
+            target = "badgeMonth"
+        elif "bt-date-badge__day" in classes:
+            target = "badgeDay"
+        if target:
+            if target == "keyword":
+                self._card["keywords"].append("")
+            self._capture = target
+            self._capture_depth = 1
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _VOID_TAGS:
+            return
+        if self._card is None:
+            if self._header_depth:
+                self._header_depth -= 1
+            return
+        if self._capture:
+            self._capture_depth -= 1
+            if self._capture_depth == 0:
+                self._capture = None
+        self._card_depth -= 1
+        if self._card_depth == 0:
+            card = self._card
+            self._card = None
+            if not card["status"].strip():
+                card["status"] = ""
+            card["keywords"] = [k for k in card["keywords"] if k.strip()]
+            self.cards.append(card)
+
+    def handle_data(self, data: str) -> None:
+        if self._card is None:
+            if self._header_depth:
+                self._date_header += data
+            return
+        if self._capture == "keyword":
+            self._card["keywords"][-1] += data
+        elif self._capture:
+            self._card[self._capture] += data
+
+# Same control the browser path locates via button/a :has-text('Load more').
+_LOAD_MORE_RE = re.compile(r"load\s+more", re.I)
+
+def _http_cache_path(url: str) -> Path:
+    return CACHE_DIR / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+def _load_http_cache(url: str) -> Optional[dict]:
+    try:
+        return json_loads(_http_cache_path(url).read_bytes())
+    except Exception:
+        return None
+
+def _save_http_cache(url: str, etag: str, last_modified: str, events: List[Event]) -> None:
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        _http_cache_path(url).write_text(
+            json_dumps_compact(
+                {
+                    "url": url,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "items": [event_to_dict(e) for e in events],
+                }
+            ),
+            encoding="utf-8",
+        )
+    except Exception:
+        pass  # cache is best-effort; never fail the run over it
+
+def fetch_events_http() -> List[Event]:
+    """Fast path: fetch the listing over plain HTTP and parse the server-
+    rendered markup. Skips Chromium launch and rendering entirely; returns
+    [] when the page is client-rendered — or only partially rendered — and
+    needs the browser path.
+
+    Sends a conditional GET using the validators from the previous run; on
+    304 the cached parse is reused and the body is never re-parsed.
+    """
+    cached = _load_http_cache(URL)
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    with httpx.Client(follow_redirects=True, timeout=30.0) as client:
+        r = client.get(URL, headers=headers)
+        if r.status_code == 304 and cached:
+            events = [e for e in (dict_to_event(d) for d in cached.get("items", [])) if e]
+            if events:
+                return events
+        r.raise_for_status()
+        html = r.text
+
+    # A "Load more" control in the raw markup means the server rendered only
+    # the first page of a paginated listing. Parsing that would overwrite
+    # state with a truncated event list, so hand off to the browser path,
+    # which clicks through the pagination.
+    if _LOAD_MORE_RE.search(html):
+        return []
+
+    parser = _CardHTMLParser()
+    parser.feed(html)
+    parser.close()
+    events = _events_from_cards(parser.cards)
+    if events:
+        _save_http_cache(URL, r.headers.get("etag", ""), r.headers.get("last-modified", ""), events)
+    return events
+
+# Resource types the scrape never reads. Stylesheets stay enabled: the
+# "Load more" visibility checks depend on CSS being applied.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+# Asset extensions and third-party analytics/ad hosts that slip past the
+# resource-type check (beacons and pixels often arrive as xhr/fetch).
+_BLOCKED_URL_RE = re.compile(
+    r"\.(?:png|jpe?g|webp|svg|gif|ico|woff2?)(?:\?|$)"
+    r"|googletagmanager|google-analytics|doubleclick|adsbygoogle"
+    r"|facebook\.net|hotjar|clarity\.ms",
+    re.I,
+)
+
+def _block_heavy_resources(page) -> None:
+    def handler(route):
+        req = route.request
+        if req.resource_type in _BLOCKED_RESOURCE_TYPES or _BLOCKED_URL_RE.search(req.url):
+            route.abort()
+        else:
+            route.continue_()
+
+    page.route("**/*", handler)
+
+# Runs once in the browser and returns every card as a plain dict; doing the
+# DOM walk in-page avoids a CDP round-trip per field per card. Fed to
+# eval_on_selector_all, which resolves the card list and ships this single
+# function into the page. Dedup (Map by href) and date parsing (partition
+# header, badge fallback) also happen here, so Python receives unique cards
+# with y/m/d already resolved; the HTML fast path still ships raw header
+# strings and relies on the fallbacks in _events_from_cards.
+_CARD_EXTRACT_JS = """
+(cards) => {
+  const text = (el) => ((el ? el.textContent : '') || '').trim();
+  const MONTHS = {JANUARY: 1, FEBRUARY: 2, MARCH: 3, APRIL: 4, MAY: 5, JUNE: 6,
+                  JULY: 7, AUGUST: 8, SEPTEMBER: 9, OCTOBER: 10, NOVEMBER: 11, DECEMBER: 12};
+  const HDR = /^([A-Za-z]+) (\\d{1,2}), (\\d{4})$/;
+  const byHref = new Map();
+  for (const card of cards) {
+    const href = card.getAttribute('href') || '';
+    if (!href || byHref.has(href)) continue;
+    const hdr = text(card.closest('.partition')?.querySelector('h2.separator-title span'))
+      .replace(/\\s+/g, ' ');
+    let y = 0, m = 0, d = 0;
+    const hm = HDR.exec(hdr);
+    if (hm && MONTHS[hm[1].toUpperCase()]) {
+      y = +hm[3]; m = MONTHS[hm[1].toUpperCase()]; d = +hm[2];
+    } else {
+      const mon = MONTHS[text(card.querySelector('.bt-date-badge__month')).toUpperCase()];
+      const day = parseInt(text(card.querySelector('.bt-date-badge__day')), 10);
+      if (mon && day) { y = new Date().getFullYear(); m = mon; d = day; }
     }
-    STATE_FILE.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    byHref.set(href, {
+      href,
+      title: text(card.querySelector('.product-item__name')),
+      time: text(card.querySelector('time')),
+      venue: text(card.querySelector('.product-item__venue')),
+      status: Array.from(card.querySelectorAll('.product-item__price'))
+        .map((el) => text(el))
+        .find(Boolean) || '',
+      keywords: Array.from(
+        card.querySelectorAll('.keyword-container .event-keyword span'),
+        (s) => text(s)
+      ),
+      y, m, d,
+    });
+  }
+  return Array.from(byHref.values());
+}
+"""
 
-def write_outputs(events: List[Event]) -> None:
-    PRETTY_FILE.write_text(
-        json.dumps([event_to_dict(e) for e in events], ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
-    md_lines = ["# Boston Athenaeum events\n"]
-    for e in events:
-        kw = f" ({', '.join(e.keywords)})" if e.keywords else ""
-        status = f"[{e.status}] " if e.status else ""
-        md_lines.append(f"- {e.when_str()} -- {status}{e.title}{kw}".strip())
-    MD_FILE.write_text("\n".join(md_lines) + "\n", encoding="utf-8")
+def wait_for_idle(page, quiet_ms: int = 500, timeout_ms: int = 10000) -> None:
+    """Wait until no requests have been in flight for `quiet_ms`.
+
+    Unlike wait_for_load_state("networkidle"), this can't hang for the full
+    timeout on pages that poll analytics forever: it resolves after a short
+    quiet window and gives up cleanly at `timeout_ms`.
+    """
+    pending = {"count": 0}
+
+    def _started(_req) -> None:
+        pending["count"] += 1
+
+    def _settled(_req) -> None:
+        pending["count"] = max(0, pending["count"] - 1)
+
+    page.on("request", _started)
+    page.on("requestfinished", _settled)
+    page.on("requestfailed", _settled)
+    try:
+        deadline = time.monotonic() + timeout_ms / 1000.0
+        quiet_since = None
+        while time.monotonic() < deadline:
+            if pending["count"] == 0:
+                if quiet_since is None:
+                    quiet_since = time.monotonic()
+                elif time.monotonic() - quiet_since >= quiet_ms / 1000.0:
+                    return
+            else:
+                quiet_since = None
+            # Short pump so Playwright keeps dispatching network events.
+            page.wait_for_timeout(50)
+    finally:
+        page.remove_listener("request", _started)
+        page.remove_listener("requestfinished", _settled)
+        page.remove_listener("requestfailed", _settled)
+
+def _wait_for_more_cards(page, before: int, timeout_ms: int = 8000) -> None:
+    # Resolves the instant new cards land in the DOM — no quiet-window
+    # padding. Timing out just means "no more cards"; the caller's count
+    # comparison handles that.
+    try:
+        page.wait_for_function(
+            "prev => document.querySelectorAll('a.product-item[href]').length > prev",
+            arg=before,
+            timeout=timeout_ms,
+        )
+    except PWTimeoutError:
+        pass
 
 def goto_with_retry(page, url: str, tries: int = 3) -> None:
     last = None
@@ -257,16 +637,21 @@ def goto_with_retry(page, url: str, tries: int = 3) -> None:
 
 def fetch_events() -> List[Event]:
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+        # Persistent profile: later runs reuse the HTTP cache and compiled
+        # JS bundles instead of cold-starting from an empty profile.
+        ctx = p.chromium.launch_persistent_context(str(USER_DATA_DIR), headless=True)
+        page = ctx.pages[0] if ctx.pages else ctx.new_page()
+        _block_heavy_resources(page)
 
         goto_with_retry(page, URL)
+        wait_for_idle(page)
 
         # Click "Load more" repeatedly.
         load_more = page.locator("button:has-text('Load more'), a:has-text('Load more')")
 
         def count_cards() -> int:
-            return page.locator("a.product-item[href]").count()
+            # Single evaluate beats resolving a fresh locator every poll.
+            return page.evaluate("document.querySelectorAll('a.product-item[href]').length")
 
         for _ in range(80):
             try:
@@ -277,12 +662,18 @@ def fetch_events() -> List[Event]:
                     break
                 before = count_cards()
                 btn.click()
-                # networkidle is flaky on Actions; use domcontentloaded + small wait
-                page.wait_for_load_state("domcontentloaded", timeout=30000)
-                page.wait_for_timeout(500)
+                _wait_for_more_cards(page, before)
                 after = count_cards()
                 if after <= before:
                     break
+                # The button disables/hides itself once the listing is
+                # exhausted; bail now instead of paying a no-op click cycle.
+                if (
+                    btn.is_hidden()
+                    or btn.get_attribute("disabled") is not None
+                    or btn.get_attribute("aria-disabled") == "true"
+                ):
+                    break
             except PWTimeoutError:
                 break
             except Exception:
@@ -292,162 +683,140 @@ def fetch_events() -> List[Event]:
         for _ in range(8):
             before = count_cards()
             page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            page.wait_for_timeout(800)
-            try:
-                page.wait_for_load_state("domcontentloaded", timeout=15000)
-            except Exception:
-                pass
+            _wait_for_more_cards(page, before)
             after = count_cards()
             if after <= before:
                 break
 
-        cards = page.locator("a.product-item[href]")
-        n = cards.count()
-
-        seen = set()
-        out: List[Event] = []
-
-        for i in range(n):
-            a = cards.nth(i)
-
-            href = a.get_attribute("href") or ""
-            abs_url = urljoin("https://events.bostonathenaeum.org", href)
-            if not looks_like_event_url(abs_url):
-                continue
+        # One round-trip: pull every card's fields out of the DOM at once.
+        raw_cards = page.eval_on_selector_all("a.product-item[href]", _CARD_EXTRACT_JS)
 
-            # Title
-            try:
-                title = norm(a.locator(".product-item__name").first.inner_text(timeout=1000))
-            except Exception:
-                title = ""
-            if not title:
-                continue
+        ctx.close()
 
-            # Time
-            try:
-                time_et = norm(a.locator("time").first.inner_text(timeout=1000)).upper()
-            except Exception:
-                time_et = ""
+    return _events_from_cards(raw_cards)
 
-            # Venue
-            try:
-                venue = norm(a.locator(".product-item__venue").first.inner_text(timeout=1000))
-            except Exception:
-                venue = ""
+def _events_from_cards(raw_cards: List[dict]) -> List[Event]:
+    seen = set()
+    out: List[Event] = []
 
-            # Status (often in ".product-item__price")
-            status = ""
-            try:
-                prices = a.locator(".product-item__price")
-                for j in range(min(prices.count(), 3)):
-                    s = norm(prices.nth(j).inner_text(timeout=500))
-                    if s:
-                        status = normalize_status(s)
-                        break
-            except Exception:
-                status = ""
+    for c in raw_cards:
+        abs_url = urljoin("https://events.bostonathenaeum.org", c.get("href") or "")
+        if not looks_like_event_url(abs_url):
+            continue
 
-            # Keywords
-            keywords: List[str] = []
-            try:
-                kw_spans = a.locator(".keyword-container .event-keyword span")
-                for s in kw_spans.all_inner_texts():
-                    s = norm(s)
-                    if s:
-                        keywords.append(s)
-            except Exception:
-                keywords = []
+        title = norm(c.get("title") or "")
+        if not title:
+            continue
 
-            # Date: partition header preferred, else badge
-            ymd = None
+        time_et = norm(c.get("time") or "").upper()
+        venue = norm(c.get("venue") or "")
+        status = normalize_status(c.get("status") or "")
+        keywords = [k for k in (norm(s) for s in (c.get("keywords") or [])) if k]
+
+        # Date: pre-parsed ints from the in-page extractor when present,
+        # else partition header, else badge (HTML fast path).
+        ymd = None
+        if c.get("m"):
+            ymd = (c["y"], c["m"], c["d"])
+        if not ymd:
+            ymd = parse_date_header(c.get("dateHeader") or "")
+        if not ymd:
             try:
-                hdr = a.locator(
-                    "xpath=ancestor::div[contains(@class,'partition')][1]//h2[contains(@class,'separator-title')]//span"
-                ).first
-                ymd = parse_date_header(hdr.inner_text(timeout=1000))
+                mon = norm(c.get("badgeMonth") or "").upper()
+                day = int(norm(c.get("badgeDay") or ""))
+                month = MONTHS.get(mon)
+                if month:
+                    ymd = (datetime.now().year, month, day)
             except Exception:
                 ymd = None
 
-            if not ymd:
-                try:
-                    mon = norm(a.locator(".bt-date-badge__month").first.inner_text(timeout=500)).upper()
-                    day = int(norm(a.locator(".bt-date-badge__day").first.inner_text(timeout=500)))
-                    year = datetime.now().year
-                    month = MONTHS.get(mon)
-                    if month:
-                        ymd = (year, month, day)
-                except Exception:
-                    ymd = None
-
-            if not ymd:
-                continue
+        if not ymd:
+            continue
 
-            year, month, day = ymd
-
-            e = Event(
-                url=abs_url,
-                year=year,
-                month=month,
-                day=day,
-                time_et=time_et,
-                status=status,
-                title=title,
-                venue=venue,
-                keywords=tuple(keywords),
-            )
+        year, month, day = ymd
 
-            if e.key() in seen:
-                continue
-            seen.add(e.key())
-            out.append(e)
+        e = Event(
+            url=abs_url,
+            year=year,
+            month=month,
+            day=day,
+            time_et=time_et,
+            status=status,
+            title=title,
+            venue=venue,
+            keywords=tuple(keywords),
+        )
 
-        browser.close()
+        if e.key() in seen:
+            continue
+        seen.add(e.key())
+        out.append(e)
 
-        out.sort(key=lambda e: (e.year, e.month, e.day, e.time_et, e.title.lower(), e.url))
-        return out
+    out.sort(key=_EVENT_ORDER_URL)
+    return out
 
 def main() -> None:
     notify_first_run = "--notify-first-run" in sys.argv
+    force_render = "--render" in sys.argv
 
     now = datetime.now().isoformat(timespec="seconds")
 
     old_hash, old_events = load_state()
     old_by_key = old_events
 
-    events = fetch_events()
+    # HTTP fast path first; fall back to the browser when the listing is
+    # client-rendered (no cards in the raw markup) or the request fails.
+    events: List[Event] = []
+    if not force_render:
+        try:
+            events = fetch_events_http()
+        except Exception:
+            events = []
+    if not events:
+        events = fetch_events()
     current_by_key = {e.key(): e for e in events}
 
     # Stable hash of event payload only (not timestamps)
-    payload_items = [event_to_dict(e) for e in events]
-    blob = json.dumps(payload_items, ensure_ascii=False, indent=2)
-    h = sha256(blob)
+    h = payload_hash(events)
 
     first_run = (old_hash == "")
 
-    current_interesting = {k: e for k, e in current_by_key.items() if is_interesting(e)}
-    old_interesting = {k: e for k, e in old_by_key.items() if is_interesting(e)}
+    # Identical payload means no new listings, no status flips, and nothing
+    # to rewrite: bail before diffing, notifying, or serializing anything.
+    if (not first_run) and old_hash and h == old_hash:
+        print(f"State: {STATE_FILE}")
+        print(f"Items found: {len(events)}")
+        print("Status: no changes (not rewriting state.json)")
+        return
 
-    # Newly listed (new URL among interesting)
-    new_interesting = [e for k, e in current_interesting.items() if k not in old_interesting]
-    new_interesting.sort(key=lambda e: (e.year, e.month, e.day, e.time_et, e.title.lower()))
+    # Diff key sets first, then filter only what changed; the steady state
+    # (few or no changes) does O(changes) predicate work instead of
+    # re-filtering both full snapshots.
 
-    # Reopened: previously SOLD OUT -> now not SOLD OUT (among interesting)
+    # Newly listed (new URL among interesting)
+    new_keys = current_by_key.keys() - old_by_key.keys()
+    new_interesting = [e for k in new_keys if is_interesting(e := current_by_key[k])]
+    new_interesting.sort(key=_EVENT_ORDER)
+
+    # Reopened: previously SOLD OUT -> now not SOLD OUT (among interesting).
+    # Only the key set matters on the old side; statuses are already
+    # uppercased by normalize_status at construction.
+    old_sold_out_keys = {
+        k for k, e in old_by_key.items()
+        if e._is_interesting and e.status == "SOLD OUT"
+    }
     reopened_interesting: List[Tuple[Event, str, str]] = []
-    for k, cur in current_interesting.items():
-        prev = old_interesting.get(k)
-        if not prev:
-            continue
-        old_status = (prev.status or "").upper()
-        new_status = (cur.status or "").upper()
-        if old_status == "SOLD OUT" and new_status != "SOLD OUT":
-            reopened_interesting.append((cur, old_status, new_status))
-    reopened_interesting.sort(key=lambda t: (t[0].year, t[0].month, t[0].day, t[0].time_et, t[0].title.lower()))
+    for k in old_sold_out_keys & current_by_key.keys():
+        cur = current_by_key[k]
+        if cur.status != "SOLD OUT" and cur._is_interesting:
+            reopened_interesting.append((cur, "SOLD OUT", cur.status))
+    reopened_interesting.sort(key=lambda t: _EVENT_ORDER(t[0]))
 
     # Notifications
     if first_run and notify_first_run:
         baseline_list = sorted(
-            current_interesting.values(),
-            key=lambda e: (e.year, e.month, e.day, e.time_et, e.title.lower()),
+            (e for e in current_by_key.values() if is_interesting(e)),
+            key=_EVENT_ORDER,
         )
         lines = [f"Baseline (interesting events): {len(baseline_list)}"]
         lines.extend(fmt_line(e) for e in baseline_list)
@@ -472,15 +841,12 @@ def main() -> None:
             title_bits.append(f"{len(reopened_interesting)} reopened")
         notify("Athenaeum events: " + ", ".join(title_bits), "\n".join(lines))
 
-    # Avoid spam commits: only write files if payload changed (or first run).
-    if (not first_run) and old_hash and h == old_hash:
-        print(f"State: {STATE_FILE}")
-        print(f"Items found: {len(events)}")
-        print("Status: no changes (not rewriting state.json)")
-        return
+    # Serialized once, only when we actually write; shared by state + pretty.
+    payload_items = [event_to_dict(e) for e in events]
+    items_json = json_dumps_pretty(payload_items)
 
-    save_state(now, events, h)
-    write_outputs(events)
+    save_state(now, items_json, h)
+    write_outputs(items_json, events)
 
     print(f"State: {STATE_FILE}")
     print(f"Items found: {len(events)}")